@@ -1,76 +1,394 @@
 import sys
 import os
+import io
+import ctypes
+import platform
 import shutil
 import tempfile
+import time
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from multiprocessing import Pool, Queue, TimeoutError as PoolTimeoutError, cpu_count, freeze_support
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout,
                              QWidget, QLineEdit, QProgressBar, QMessageBox,
-                             QFileDialog, QDialog, QLabel, QMenuBar, QAction)
+                             QFileDialog, QDialog, QLabel, QMenuBar, QAction, QActionGroup)
 from PyQt5.QtCore import QSettings, QThread, pyqtSignal, Qt
-from PyQt5.QtGui import QIcon
-from PIL import Image
+from PyQt5.QtGui import QIcon, QPalette, QColor
+import PIL
+from PIL import Image, features
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import pygetwindow as gw
 
-# Set up logging
-logging.basicConfig(
-    filename='app.log',
-    level=logging.DEBUG,
-    format='%(asctime)s %(levelname)s:%(message)s'
-)
+# Records from the GUI and every pool worker are queued to one listener that owns
+# app.log, so logging never blocks on disk and processes don't interleave writes
+logger = logging.getLogger('feather')
 
 settings = QSettings("RonsinPhotocopy", "Feather")
 
-def process_image(data):
-    file_path, target_size = data
-    logging.info(f"Processing {file_path}")
+# Letter page at 300 DPI. As a module constant it is already set in every pool worker,
+# so each task only has to pickle the file path.
+DPI = 300
+PAGE_SIZE_PIXELS = (int(8.5 * DPI), int(11 * DPI))
+
+# Bicubic is several times cheaper than Lanczos and indistinguishable on a printed copy page
+RESAMPLE_FILTERS = {
+    'lanczos': Image.LANCZOS,
+    'bicubic': Image.BICUBIC,
+    'hamming': Image.HAMMING,
+    'bilinear': Image.BILINEAR,
+}
+DEFAULT_RESAMPLE_FILTER = 'bicubic'
+
+IMAGE_EXTENSIONS = frozenset(('.jpg', '.jpeg', '.png', '.tiff', '.tif'))
+JPEG_EXTENSIONS = frozenset(('.jpg', '.jpeg'))
+
+# Leave a quarter of the cores free for the GUI, Wincopy and the prefetch threads
+WORKER_COUNT = max(1, round(cpu_count() * 0.75))
+MAX_CHUNKSIZE = 8
+
+# Seconds between progress bar updates (~30 Hz)
+PROGRESS_INTERVAL = 1 / 30
+
+# How often a running batch checks whether it has been cancelled, in seconds
+CANCEL_POLL_INTERVAL = 0.1
+
+PREFETCH_THREADS = 4
+PREFETCH_CHUNK_SIZE = 1024 * 1024
+
+# Windows refuses to replace a file another handle still has open, so retry the swap briefly
+REPLACE_ATTEMPTS = 5
+REPLACE_RETRY_DELAY = 0.1
+
+# Marks replace_file's temp files so ones left by killed workers can be found and removed
+TEMP_PREFIX = '.feather-'
+
+WINCOPY_TITLE = 'Photocopy Orders: 1 - Cloud'
+
+# White pages reused by this process, keyed by size
+_canvases = {}
+
+def log_imaging_backend():
+    # Pillow-SIMD is a drop-in replacement that tags its versions with a .postN suffix
+    if '.post' in PIL.__version__:
+        logger.info(f"Using Pillow-SIMD {PIL.__version__}")
+    elif platform.machine().lower() in ('amd64', 'x86_64', 'i386', 'i686', 'x86'):
+        logger.info(f"Using stock Pillow {PIL.__version__}; install pillow-simd for faster resizing")
+    else:
+        # Pillow-SIMD's kernels are SSE4/AVX2 only, so there is nothing to gain on ARM
+        logger.info(f"Using stock Pillow {PIL.__version__}")
+
+    if features.check_feature('libjpeg_turbo'):
+        logger.info(f"JPEG codec: libjpeg-turbo {features.version_feature('libjpeg_turbo')}")
+    else:
+        logger.warning("Pillow is not linked against libjpeg-turbo; JPEG decode/encode will be slow")
+
+# Palettes don't cover the progress bar fill, so that one colour stays in CSS
+PROGRESS_CHUNK_STYLE = "QProgressBar::chunk { background-color: #06b; }"
+
+@lru_cache(maxsize=None)
+def build_palette(dark_mode):
+    # Built once per theme; swapping palettes avoids re-parsing a stylesheet on every toggle
+    if dark_mode:
+        window, text, control, highlight = '#333', 'white', '#555', '#06b'
+    else:
+        window, text, control, highlight = '#eee', 'black', '#ccc', '#a0c4ff'
+
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(window))
+    palette.setColor(QPalette.WindowText, QColor(text))
+    palette.setColor(QPalette.Base, QColor(control))
+    palette.setColor(QPalette.AlternateBase, QColor(window))
+    palette.setColor(QPalette.Text, QColor(text))
+    palette.setColor(QPalette.Button, QColor(control))
+    palette.setColor(QPalette.ButtonText, QColor(text))
+    palette.setColor(QPalette.Highlight, QColor(highlight))
+    palette.setColor(QPalette.HighlightedText, QColor(text))
+    return palette
+
+def iter_images(root):
+    # os.scandir hands back the entry type with the listing, so no extra stat per file
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                    yield entry
+    except OSError:
+        # Like os.walk, skip directories that cannot be listed
+        return
+
+    for subdir in subdirs:
+        yield from iter_images(subdir)
+
+def is_jpeg(file_path):
+    return os.path.splitext(file_path)[1].lower() in JPEG_EXTENSIONS
+
+def entry_size(entry):
+    # On Windows the size comes with the directory listing, so this costs no extra syscall
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
 
+def prefetch_file(file_path):
+    # Read the file once so it is already in the OS cache when a pool worker opens it.
+    # Pages the worker will skip after the header need nothing beyond the header itself.
+    try:
+        with open(file_path, 'rb') as f:
+            with Image.open(f) as header:
+                if is_processed_page(header):
+                    return
+            while f.read(PREFETCH_CHUNK_SIZE):
+                pass
+    except Exception:
+        # Best effort only; the worker reports anything that is actually wrong with the file
+        pass
+
+def get_canvas(size):
+    # Reusing a page is much cheaper than allocating a fresh one for every file. It still
+    # holds the previous image, so callers must white out whatever they don't paste over.
+    canvas = _canvases.get(size)
+    if canvas is None:
+        canvas = _canvases[size] = Image.new('RGB', size, 'white')
+    return canvas
+
+def fill_margins(canvas, box):
+    # Only the strips around the pasted image need clearing, usually a few percent of the page
+    width, height = canvas.size
+    left, top = max(box[0], 0), max(box[1], 0)
+    right, bottom = min(box[2], width), min(box[3], height)
+    for strip in ((0, 0, width, top), (0, bottom, width, height),
+                  (0, top, left, bottom), (right, top, width, bottom)):
+        if strip[0] < strip[2] and strip[1] < strip[3]:
+            canvas.paste((255, 255, 255), strip)
+
+def configure_logging(log_queue):
+    # Forked workers inherit the parent's handler, so only add one if it isn't already there
+    if not logger.handlers:
+        logger.addHandler(QueueHandler(log_queue))
+    # The per-file trace is only worth the log traffic when debugging; set FEATHER_DEBUG to get it
+    logger.setLevel(logging.DEBUG if os.environ.get('FEATHER_DEBUG') else logging.INFO)
+
+def start_log_listener(log_queue):
+    file_handler = logging.FileHandler('app.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s:%(message)s'))
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    return listener
+
+def init_worker(log_queue):
+    configure_logging(log_queue)
+
+def create_worker_pool(log_queue):
+    return Pool(WORKER_COUNT, initializer=init_worker, initargs=(log_queue,))
+
+def replace_file(file_path, data):
+    # Write next to the original and swap it in, so a crash never leaves a half-written scan
+    fd, temp_path = tempfile.mkstemp(suffix='.tmp', prefix=TEMP_PREFIX, dir=os.path.dirname(file_path))
     try:
-        if file_path.lower().endswith(('.jpeg', '.jpg')):
-            with Image.open(file_path) as img:
-                img = img.convert('RGB')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        shutil.copymode(file_path, temp_path)
+        for attempt in range(REPLACE_ATTEMPTS):
+            try:
+                os.replace(temp_path, file_path)
+                break
+            except PermissionError:
+                if attempt == REPLACE_ATTEMPTS - 1:
+                    raise
+                time.sleep(REPLACE_RETRY_DELAY)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+def remove_temp_files(file_paths):
+    # A worker killed between writing its temp file and swapping it in leaves the temp file behind
+    for directory in {os.path.dirname(file_path) for file_path in file_paths}:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(TEMP_PREFIX) and entry.name.endswith('.tmp'):
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+
+def sizes_match(size, other):
+    # Off-by-one differences come from DPI rounding and draft() rounding up; not worth a resample
+    return abs(size[0] - other[0]) <= 1 and abs(size[1] - other[1]) <= 1
+
+def is_processed_page(header):
+    # A full 300 DPI RGB page has already been through Feather and is left as it is
+    dpi = header.info.get('dpi', (DPI, DPI))[0]
+    return sizes_match(header.size, PAGE_SIZE_PIXELS) and header.mode == 'RGB' and abs(dpi - DPI) < 0.5
+
+def process_image(file_path, resample_filter=RESAMPLE_FILTERS[DEFAULT_RESAMPLE_FILTER], optimize=False):
+    logger.debug(f"Processing {file_path}")
 
-                original_dpi = img.info.get('dpi', (300, 300))[0]
+    try:
+        if is_jpeg(file_path):
+            with open(file_path, 'rb') as f:
+                # Image.open only parses the header, so files that are already a full 300 DPI RGB
+                # page are skipped without reading or decoding the rest of the file
+                with Image.open(f) as header:
+                    original_dpi = header.info.get('dpi', (DPI, DPI))[0]
+                    if is_processed_page(header):
+                        logger.debug(f"Processed {file_path}: skipped, already correct size")
+                        return True
+
+                # One read of the whole file; decoding from memory avoids many small reads on network shares
+                f.seek(0)
+                data = f.read()
+
+            with Image.open(io.BytesIO(data)) as source:
+                img = source
                 original_size_inches = (img.width / original_dpi, img.height / original_dpi)
-                target_size_pixels = (int(original_size_inches[0] * 300), int(original_size_inches[1] * 300))
-
-                img = img.resize(target_size_pixels, Image.LANCZOS)
-                new_img = Image.new('RGB', target_size, 'white')
-
-                x = (target_size[0] - img.width) // 2
-                y = (target_size[1] - img.height) // 2
-                new_img.paste(img, (x, y))
-
-                new_img.save(file_path, 'JPEG', quality=70, dpi=(300, 300))
-
-        return 'success'
+                target_size_pixels = (int(original_size_inches[0] * DPI), int(original_size_inches[1] * DPI))
+
+                # For sources well above 300 DPI libjpeg can decode straight to 1/2, 1/4 or 1/8
+                # scale, which saves IDCT work and leaves far fewer pixels for the resize
+                img.draft('RGB', target_size_pixels)
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+
+                x = (PAGE_SIZE_PIXELS[0] - target_size_pixels[0]) // 2
+                y = (PAGE_SIZE_PIXELS[1] - target_size_pixels[1]) // 2
+
+                if not sizes_match(target_size_pixels, img.size):
+                    # Pages larger than letter get cropped by the centred paste, so only resample
+                    # the part of the source that actually lands on the page
+                    left, top = max(-x, 0), max(-y, 0)
+                    visible_size = (min(target_size_pixels[0], PAGE_SIZE_PIXELS[0]),
+                                    min(target_size_pixels[1], PAGE_SIZE_PIXELS[1]))
+                    scale_x = img.width / target_size_pixels[0]
+                    scale_y = img.height / target_size_pixels[1]
+                    box = (left * scale_x, top * scale_y,
+                           (left + visible_size[0]) * scale_x, (top + visible_size[1]) * scale_y)
+
+                    # reducing_gap lets Pillow box-reduce by the integer part of the scale
+                    # before the filter pass, so large downscales convolve far fewer pixels
+                    img = img.resize(visible_size, resample_filter, box=box, reducing_gap=3.0)
+                    x, y = max(x, 0), max(y, 0)
+
+                    # Free the decoded scan now rather than holding it through the paste and encode
+                    source.close()
+
+                if img.size == PAGE_SIZE_PIXELS:
+                    # The image already covers the whole page, so there is no border to add
+                    new_img = img
+                else:
+                    new_img = get_canvas(PAGE_SIZE_PIXELS)
+                    new_img.paste(img, (x, y))
+                    fill_margins(new_img, (x, y, x + img.width, y + img.height))
+
+                # Baseline 4:2:0 with standard Huffman tables is the cheapest encode libjpeg offers;
+                # optimize adds a second pass for slightly smaller files
+                output = io.BytesIO()
+                new_img.save(output, 'JPEG', quality=70, dpi=(DPI, DPI),
+                             subsampling=2, optimize=optimize, progressive=False)
+
+            replace_file(file_path, output.getbuffer())
+
+        logger.debug(f"Processed {file_path}: success")
+        return True
     except Exception as e:
-        logging.error(f"Error processing {file_path}: {str(e)}")
-        return f'error: {str(e)}'
+        logger.error(f"Error processing {file_path}: {str(e)}")
+        return False
+
+def process_images(file_paths, resample_filter, optimize):
+    return [process_image(file_path, resample_filter, optimize) for file_path in file_paths]
 
 class ImageProcessor(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal()
 
-    def __init__(self, file_paths, target_size_pixels):
+    def __init__(self, file_paths, pool):
         super().__init__()
         self.file_paths = file_paths
-        self.target_size_pixels = target_size_pixels
+        self.pool = pool
+        self.resample_filter = RESAMPLE_FILTERS.get(settings.value("resampleFilter", DEFAULT_RESAMPLE_FILTER),
+                                                    RESAMPLE_FILTERS[DEFAULT_RESAMPLE_FILTER])
+        self.optimize = settings.value("optimizeJpeg", False, type=bool)
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
 
     def run(self):
         total_files = len(self.file_paths)
         progress_step = 100 / total_files if total_files > 0 else 100
 
-        for i, file_path in enumerate(self.file_paths):
-            result = process_image((file_path, self.target_size_pixels))
-            logging.info(f"Processed {file_path}: {result}")
-            progress_value = int((i + 1) * progress_step)
-            self.progress.emit(progress_value)
-
+        # Enough chunks per worker to balance the load, but big enough to amortise pickling.
+        # Capped so a run of large scans can't pin one worker while the rest sit idle at the end.
+        chunksize = max(1, min(MAX_CHUNKSIZE, total_files // (WORKER_COUNT * 8)))
+        task = partial(process_images, resample_filter=self.resample_filter, optimize=self.optimize)
+
+        # Keep a bounded window of upcoming files warm in the OS cache so disk and
+        # network reads overlap with the resize work instead of stalling the workers.
+        # Only JPEGs are ever opened by process_image, so nothing else is worth reading.
+        # The first chunk for every worker is dispatched straight away, so start past those;
+        # reading a file a worker already has would only hold it open while the worker replaces it.
+        in_flight = WORKER_COUNT * chunksize
+        upcoming = (file_path for file_path in islice(self.file_paths, in_flight, None) if is_jpeg(file_path))
+        last_emitted = -1
+        last_emit_time = 0.0
+        errors = 0
+        with ThreadPoolExecutor(max_workers=PREFETCH_THREADS) as prefetcher:
+            for file_path in islice(upcoming, WORKER_COUNT * 8):
+                prefetcher.submit(prefetch_file, file_path)
+
+            # Chunks are formed here rather than by imap_unordered's chunksize, because only the
+            # unchunked iterator supports next(timeout), which lets a cancel interrupt the wait
+            chunks = [self.file_paths[j:j + chunksize] for j in range(0, total_files, chunksize)]
+            results = self.pool.imap_unordered(task, chunks)
+            i = 0
+            while i < total_files:
+                if self.cancelled:
+                    prefetcher.shutdown(wait=False, cancel_futures=True)
+                    return
+
+                try:
+                    chunk_results = results.next(timeout=CANCEL_POLL_INTERVAL)
+                except PoolTimeoutError:
+                    continue
+
+                for succeeded in chunk_results:
+                    if not succeeded:
+                        errors += 1
+                    next_path = next(upcoming, None)
+                    if next_path is not None:
+                        prefetcher.submit(prefetch_file, next_path)
+                    i += 1
+
+                progress_value = int(i * progress_step)
+                # Only cross into the GUI thread when the bar would actually move, and no more
+                # often than the screen can usefully redraw it. The last file always gets through.
+                now = time.monotonic()
+                last_file = i == total_files
+                if progress_value != last_emitted and (now - last_emit_time >= PROGRESS_INTERVAL or last_file):
+                    self.progress.emit(progress_value)
+                    last_emitted = progress_value
+                    last_emit_time = now
+
+        logger.info(f"Processed {total_files} images with {errors} errors")
         self.finished.emit()
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, log_queue):
         super().__init__()
+
+        # Resizing is CPU-bound, so spread files across processes to sidestep the GIL. The pool
+        # lives as long as the window so each batch doesn't pay for spawning fresh interpreters.
+        self.pool = create_worker_pool(log_queue)
+        self.wincopy_window = None
+        self.processor = None
+
         self.initUI()
         self.loadSettings()
         self.force_to_front()
@@ -100,6 +418,7 @@ class MainWindow(QMainWindow):
 
         self.progress_total = QProgressBar(self)
         self.progress_total.setAlignment(Qt.AlignCenter)
+        self.progress_total.setStyleSheet(PROGRESS_CHUNK_STYLE)
         layout.addWidget(self.progress_total)
 
         central_widget = QWidget()
@@ -122,6 +441,22 @@ class MainWindow(QMainWindow):
         self.closeFeatherAction.triggered.connect(self.close_feather_after_processing)
         extrasMenu.addAction(self.closeFeatherAction)
 
+        self.optimizeJpegAction = QAction('Optimize JPEG File Size (Slower)', self)
+        self.optimizeJpegAction.setCheckable(True)
+        self.optimizeJpegAction.triggered.connect(lambda: settings.setValue("optimizeJpeg", self.optimizeJpegAction.isChecked()))
+        extrasMenu.addAction(self.optimizeJpegAction)
+
+        resampleMenu = extrasMenu.addMenu('Resampling Filter')
+        resampleGroup = QActionGroup(self)
+        self.resampleFilterActions = {}
+        for name in RESAMPLE_FILTERS:
+            action = QAction(name.capitalize(), self)
+            action.setCheckable(True)
+            action.triggered.connect(lambda checked, name=name: settings.setValue("resampleFilter", name))
+            resampleGroup.addAction(action)
+            resampleMenu.addAction(action)
+            self.resampleFilterActions[name] = action
+
         aboutAction = QAction('About', self)
         aboutAction.triggered.connect(self.show_about_dialog)
         extrasMenu.addAction(aboutAction)
@@ -130,6 +465,9 @@ class MainWindow(QMainWindow):
         self.dark_mode = settings.value("darkMode", True, type=bool)
         self.summonWincopyAction.setChecked(settings.value("summonWincopy", False, type=bool))
         self.closeFeatherAction.setChecked(settings.value("closeAfterProcessing", False, type=bool))
+        self.optimizeJpegAction.setChecked(settings.value("optimizeJpeg", False, type=bool))
+        resample_filter = settings.value("resampleFilter", DEFAULT_RESAMPLE_FILTER)
+        self.resampleFilterActions.get(resample_filter, self.resampleFilterActions[DEFAULT_RESAMPLE_FILTER]).setChecked(True)
         self.apply_theme()
 
     def toggle_theme(self):
@@ -138,60 +476,7 @@ class MainWindow(QMainWindow):
         self.apply_theme()
 
     def apply_theme(self):
-        if self.dark_mode:
-            self.setStyleSheet(""" 
-                QMainWindow, QDialog {
-                    background-color: #333;
-                    color: white;
-                }
-                QLineEdit, QPushButton, QProgressBar, QMenuBar, QMenu {
-                    background-color: #555;
-                    color: white;
-                }
-                QLabel {
-                    color: white;
-                }
-                QProgressBar {
-                    border: 1px solid #666;
-                    background-color: #333;
-                }
-                QProgressBar::chunk {
-                    background-color: #06b;
-                }
-                QMenuBar::item:selected {
-                    background-color: #06b;
-                }
-                QMenu::item:selected {
-                    background-color: #333;
-                }
-            """)
-        else:
-            self.setStyleSheet(""" 
-                QMainWindow, QDialog {
-                    background-color: #eee;
-                    color: black;
-                }
-                QLineEdit, QPushButton, QProgressBar, QMenuBar, QMenu {
-                    background-color: #ccc;
-                    color: black;
-                }
-                QLabel {
-                    color: black;
-                }
-                QProgressBar {
-                    border: 1px solid #bbb;
-                    background-color: #eee;
-                }
-                QProgressBar::chunk {
-                    background-color: #06b;
-                }
-                QMenuBar::item:selected {
-                    background-color: #a0c4ff;
-                }
-                QMenu::item:selected {
-                    background-color: #a0c4ff;
-                }
-            """)
+        QApplication.instance().setPalette(build_palette(self.dark_mode))
 
     def browse(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Folder")
@@ -200,35 +485,46 @@ class MainWindow(QMainWindow):
 
     def start_processing(self):
         directory_path = self.input_path.text()
-        dpi = 300
-        inches_to_pixels = lambda inches: int(inches * dpi)
-        target_size_pixels = (inches_to_pixels(8.5), inches_to_pixels(11))
-        
         self.progress_total.setValue(0)
 
-        # Gather file paths for processing
-        file_paths = [os.path.join(dp, f) for dp, _, filenames in os.walk(directory_path)
-                      for f in filenames if f.lower().endswith(('.jpg', '.jpeg', '.png', '.tiff', '.tif'))]
+        # Gather file paths for processing. Only JPEGs are resized, so they go first, largest
+        # first, so the slowest images start early instead of running alone at the tail of
+        # the batch. Everything else is a no-op and just trails along at the end.
+        jpegs, others = [], []
+        for entry in iter_images(directory_path):
+            (jpegs if is_jpeg(entry.path) else others).append(entry)
+        jpegs.sort(key=entry_size, reverse=True)
+        file_paths = [entry.path for entry in jpegs] + [entry.path for entry in others]
 
-        self.processor = ImageProcessor(file_paths, target_size_pixels)
+        self.processor = ImageProcessor(file_paths, self.pool)
         self.processor.progress.connect(self.progress_total.setValue)
         self.processor.finished.connect(self.processing_finished)
         self.processor.start()
 
     def processing_finished(self):
         QMessageBox.information(self, "Feather is Finished", "All images have been processed.", QMessageBox.Ok)
-        if self.summonWincopyAction.isChecked():
-            self.summon_wincopy()
+        self.summon_wincopy()
         if self.closeFeatherAction.isChecked():
             self.close()
 
     def summon_wincopy(self):
-        windows = gw.getWindowsWithTitle('Photocopy Orders: 1 - Cloud')
-        if windows:
-            window = windows[0]
-            if window.isMinimized or not window.visible:
-                window.restore()
-            window.activate()
+        if not self.summonWincopyAction.isChecked():
+            return
+
+        # Finding Wincopy by title enumerates every top-level window, so reuse the handle from
+        # the last batch while it is still Wincopy's; handles are recycled, and reading one
+        # window's title is a single call
+        window = self.wincopy_window
+        if (window is None or not ctypes.windll.user32.IsWindow(window._hWnd)
+                or WINCOPY_TITLE not in window.title):
+            windows = gw.getWindowsWithTitle(WINCOPY_TITLE)
+            if not windows:
+                return
+            window = self.wincopy_window = windows[0]
+
+        if window.isMinimized or not window.visible:
+            window.restore()
+        window.activate()
 
     def close_feather_after_processing(self):
         if self.closeFeatherAction.isChecked():
@@ -245,15 +541,36 @@ class MainWindow(QMainWindow):
         label.setAlignment(Qt.AlignCenter)
         about_dialog_layout.addWidget(label)
         about_dialog.setLayout(about_dialog_layout)
-        about_dialog.setStyleSheet(self.styleSheet())
         about_dialog.exec_()
 
     def closeEvent(self, event):
+        if self.processor is not None and self.processor.isRunning():
+            # Drop the rest of the batch rather than freezing the window until it finishes.
+            # replace_file keeps the original scans intact, but a worker killed mid-write
+            # leaves its temp file behind, so sweep those up once the pool is gone.
+            self.processor.cancel()
+            self.processor.wait()
+            self.pool.terminate()
+            self.pool.join()
+            remove_temp_files(self.processor.file_paths)
+        else:
+            self.pool.close()
+            self.pool.join()
         event.accept()
 
 if __name__ == '__main__':
-    logging.info("Starting Feather application.")
+    freeze_support()
+    log_queue = Queue()
+    log_listener = start_log_listener(log_queue)
+    configure_logging(log_queue)
+
+    logger.info("Starting Feather application.")
+    log_imaging_backend()
     app = QApplication(sys.argv)
-    ex = MainWindow()
+    # Native Windows styles ignore most palette colours; Fusion honours all of them
+    app.setStyle('Fusion')
+    ex = MainWindow(log_queue)
     ex.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    log_listener.stop()
+    sys.exit(exit_code)